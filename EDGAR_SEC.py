@@ -8,17 +8,26 @@ the data to CSV files.
 
 Usage:
     python EDGAR_SEC.py [ticker]
+    python EDGAR_SEC.py --tickers AAPL MSFT GOOGL
 
 The script will process the ticker specified in DEFAULT_TICKER by default. Provide a different ticker as a
-command-line argument to process a different company.
+command-line argument to process a different company, or pass --tickers to process a batch concurrently.
 """
 
-import requests
-import pandas as pd
+import asyncio
+import httpx
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+import csv
+import functools
+import io
 import json
-from datetime import datetime
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+import os
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,7 +35,75 @@ logger = logging.getLogger(__name__)
 
 from config import SEC_API_HEADERS, DEFAULT_TICKER
 
-headers = SEC_API_HEADERS
+# Headers shared by every SEC client: identify ourselves and ask for
+# compressed bodies, which cuts the multi-MB JSON payloads down ~5-10x.
+_CLIENT_HEADERS = {**SEC_API_HEADERS, 'Accept-Encoding': 'gzip, br'}
+
+# Shared HTTP/2 client so connections to sec.gov and data.sec.gov are reused
+# and multiplexed across calls instead of being renegotiated per request.
+SESSION = httpx.Client(
+    http2=True,
+    headers=_CLIENT_HEADERS,
+    transport=httpx.HTTPTransport(retries=5),
+)
+
+_CACHE_DIR = Path.home() / ".cache" / "edgar_sec"
+_CIK_CACHE_TTL = 24 * 60 * 60  # seconds before the on-disk ticker list is revalidated
+_CIK_CACHE = None
+# Batch runs call get_cik from several asyncio.to_thread workers at once; the
+# lock ensures only one of them fetches and builds the mapping.
+_CIK_LOCK = threading.Lock()
+
+def _load_cik_map():
+    """
+    Load the full ticker-to-CIK mapping, fetching it from SEC at most once.
+
+    The mapping is cached in memory for the lifetime of the process and on disk
+    at ~/.cache/edgar_sec/ticker.txt. The on-disk copy is revalidated with an
+    If-Modified-Since request once it is older than _CIK_CACHE_TTL. The load
+    is serialized so concurrent batch workers share one fetch.
+
+    Returns:
+        dict: A mapping of lowercased ticker symbols to integer CIKs.
+
+    Raises:
+        httpx.HTTPError: If there's an error fetching the data from SEC.
+    """
+    global _CIK_CACHE
+    if _CIK_CACHE is not None:
+        return _CIK_CACHE
+
+    with _CIK_LOCK:
+        if _CIK_CACHE is not None:
+            return _CIK_CACHE
+
+        cache_file = _CACHE_DIR / "ticker.txt"
+        text = None
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime < _CIK_CACHE_TTL:
+            text = cache_file.read_text()
+
+        if text is None:
+            url = "https://www.sec.gov/include/ticker.txt"
+            request_headers = {}
+            if cache_file.exists():
+                request_headers['If-Modified-Since'] = formatdate(cache_file.stat().st_mtime, usegmt=True)
+            response = _sec_get(url, headers=request_headers)
+            if response.status_code == 304:
+                text = cache_file.read_text()
+                os.utime(cache_file)
+            else:
+                response.raise_for_status()
+                text = response.text
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Atomic replace so a reader in another process never sees a
+                # half-written listing.
+                tmp_file = cache_file.with_suffix('.tmp')
+                tmp_file.write_text(text)
+                os.replace(tmp_file, cache_file)
+
+        _CIK_CACHE = {t.lower(): int(c) for t, c in
+                      (line.split('\t') for line in text.splitlines() if line)}
+    return _CIK_CACHE
 
 def get_cik(ticker):
     """
@@ -39,16 +116,169 @@ def get_cik(ticker):
         int or None: The CIK as an integer, or None if not found.
 
     Raises:
-        requests.RequestException: If there's an error fetching the data from SEC.
+        httpx.HTTPError: If there's an error fetching the data from SEC.
+    """
+    return _load_cik_map().get(ticker.lower())
+
+# Pace at 9 requests/second, leaving headroom under the SEC's 10/s fair-use
+# cap so a burst never trips a 429 in the first place.
+_SEC_RATE_LIMIT = 9
+_ASYNC_LIMITER = AsyncLimiter(_SEC_RATE_LIMIT, 1)
+
+def _retry_after_delay(response):
+    """Parse the Retry-After header of a 429 response into seconds."""
+    try:
+        return float(response.headers.get('Retry-After', 1))
+    except ValueError:
+        return 1.0
+
+def _sec_get(url, headers=None):
+    """Issue a sync GET against SEC, honoring Retry-After on 429."""
+    response = SESSION.get(url, headers=headers)
+    if response.status_code == 429:
+        time.sleep(_retry_after_delay(response))
+        response = SESSION.get(url, headers=headers)
+    return response
+
+async def _rate_limited_get(client, url, headers=None):
+    """
+    Issue a GET through the shared SEC token bucket, honoring Retry-After.
+
+    Every async request draws from the module-level limiter; if SEC still
+    answers 429, the advertised Retry-After is awaited before a single
+    retry rather than burning request budget on exponential backoff.
+    """
+    async with _ASYNC_LIMITER:
+        response = await client.get(url, headers=headers)
+    if response.status_code == 429:
+        await asyncio.sleep(_retry_after_delay(response))
+        async with _ASYNC_LIMITER:
+            response = await client.get(url, headers=headers)
+    return response
+
+async def _fetch_companyfacts(client, cik_padded):
+    """
+    Fetch the companyfacts JSON body for a CIK, with an on-disk ETag cache.
+
+    Companyfacts only changes when the company files, so the body is cached
+    at ~/.cache/edgar_sec/CIK{padded}.json with the server ETag in a sidecar
+    file. A conditional GET with If-None-Match turns repeat runs into a 304
+    and a local read instead of a multi-MB download.
+
+    Args:
+        client (httpx.AsyncClient): The shared client to issue the GET on.
+        cik_padded (str): The zero-padded 10-digit CIK.
+
+    Returns:
+        bytes: The raw companyfacts JSON body.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
     """
-    url = "https://www.sec.gov/include/ticker.txt"
-    response = requests.get(url, headers=headers)
+    cache_file = _CACHE_DIR / f"CIK{cik_padded}.json"
+    etag_file = cache_file.with_suffix('.etag')
+    request_headers = {}
+    if cache_file.exists() and etag_file.exists():
+        request_headers['If-None-Match'] = etag_file.read_text()
+
+    url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_padded}.json"
+    response = await _rate_limited_get(client, url, headers=request_headers)
+    if response.status_code == 304:
+        return cache_file.read_bytes()
     response.raise_for_status()
-    for line in response.text.splitlines():
-        t, c = line.split('\t')
-        if t.lower() == ticker.lower():
-            return int(c)
-    return None
+
+    etag = response.headers.get('ETag')
+    if etag:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write the body atomically and only then the ETag, so an interrupted
+        # write can never leave an ETag that validates a truncated body.
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_bytes(response.content)
+        os.replace(tmp_file, cache_file)
+        etag_file.write_text(etag)
+    return response.content
+
+# Statement item tables as (label, taxonomy, concept) tuples, pre-split from
+# the "taxonomy:concept" form so the per-filing hot path does no dict
+# allocation or string parsing.
+_INCOME_ITEMS = (
+    ('Revenue', 'us-gaap', 'Revenues'),
+    ('Cost of Revenue', 'us-gaap', 'CostOfRevenue'),
+    ('Gross Profit', 'us-gaap', 'GrossProfit'),
+    ('Operating Expenses', 'us-gaap', 'OperatingExpenses'),
+    ('Operating Income', 'us-gaap', 'OperatingIncomeLoss'),
+    ('Net Income', 'us-gaap', 'NetIncomeLoss'),
+)
+_CASH_FLOW_ITEMS = (
+    ('Cash from Operating Activities', 'us-gaap', 'NetCashProvidedByUsedInOperatingActivities'),
+    ('Cash from Investing Activities', 'us-gaap', 'NetCashProvidedByUsedInInvestingActivities'),
+    ('Cash from Financing Activities', 'us-gaap', 'NetCashProvidedByUsedInFinancingActivities'),
+    ('Net Change in Cash', 'us-gaap', 'NetIncreaseDecreaseInCash'),
+)
+_BALANCE_SHEET_ITEMS = (
+    ('Total Assets', 'us-gaap', 'Assets'),
+    ('Total Liabilities', 'us-gaap', 'Liabilities'),
+    ('Total Equity', 'us-gaap', 'StockholdersEquity'),
+    ('Cash and Cash Equivalents', 'us-gaap', 'CashAndCashEquivalentsAtCarryingValue'),
+    ('Total Current Assets', 'us-gaap', 'AssetsCurrent'),
+    ('Total Current Liabilities', 'us-gaap', 'LiabilitiesCurrent'),
+)
+
+# The us-gaap concepts the three statement processors actually report.
+# Everything else in a companyfacts body is parsed past, not materialized.
+_WANTED_CONCEPTS = frozenset(
+    concept for _, _, concept in _INCOME_ITEMS + _CASH_FLOW_ITEMS + _BALANCE_SHEET_ITEMS)
+
+def _extract_wanted_facts(raw):
+    """
+    Stream-parse a companyfacts body down to the concepts we report on.
+
+    A full companyfacts document holds hundreds of GAAP concepts with
+    hundreds of entries each, of which the statement processors read only
+    the _WANTED_CONCEPTS whitelist. Streaming with ijson builds Python
+    objects for just those concepts instead of materializing the whole
+    document.
+
+    Args:
+        raw (bytes): The raw companyfacts JSON body.
+
+    Returns:
+        dict: A companyfacts-shaped dict whose facts contain only the
+        whitelisted us-gaap concepts.
+    """
+    gaap = {concept: item_data for concept, item_data in
+            ijson.kvitems(io.BytesIO(raw), 'facts.us-gaap', use_float=True)
+            if concept in _WANTED_CONCEPTS}
+    return {'facts': {'us-gaap': gaap}}
+
+async def fetch_filing_data(cik_padded, client=None):
+    """
+    Fetch the submissions and companyfacts JSON for a CIK concurrently.
+
+    The two endpoints have no data dependency, so both GETs are issued at
+    once and the call completes in the time of the slower response.
+
+    Args:
+        cik_padded (str): The zero-padded 10-digit CIK.
+        client (httpx.AsyncClient, optional): A shared client to reuse; a
+            temporary one is created when omitted.
+
+    Returns:
+        tuple: (submissions dict, companyfacts dict) parsed from JSON.
+
+    Raises:
+        httpx.HTTPError: If either request fails.
+    """
+    if client is None:
+        async with httpx.AsyncClient(http2=True, headers=_CLIENT_HEADERS,
+                                     limits=httpx.Limits(max_connections=4)) as own_client:
+            return await fetch_filing_data(cik_padded, own_client)
+
+    subs_url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
+    subs_response, facts_content = await asyncio.gather(
+        _rate_limited_get(client, subs_url), _fetch_companyfacts(client, cik_padded))
+    subs_response.raise_for_status()
+    return orjson.loads(subs_response.content), _extract_wanted_facts(facts_content)
 
 def get_latest_10k_url(ticker):
     """
@@ -61,62 +291,179 @@ def get_latest_10k_url(ticker):
         str or None: The accession number of the latest 10-K filing, or None if not found.
 
     Raises:
-        requests.RequestException: If there's an error fetching the data from SEC.
+        httpx.HTTPError: If there's an error fetching the data from SEC.
         json.JSONDecodeError: If there's an error parsing the JSON response.
     """
-    cik = get_cik(ticker)
-    if not cik:
-        return None
-    
-    cik_padded = str(cik).zfill(10)
-    url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
-    
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = json.loads(response.text)
-        
-        allForms = pd.DataFrame.from_dict(data['filings']['recent'])
-        form10k = allForms[allForms['form'] == '10-K']
-        
-        if not form10k.empty:
-            latest_10k = form10k.iloc[0]
-            filing_date = latest_10k['filingDate']
-            accession_number = latest_10k['accessionNumber']
-            logger.info(f"Latest 10-K filing date: {filing_date}")
-            logger.info(f"Accession number: {accession_number}")
-        else:
-            logger.error("No 10-K filings found.")
-            return None
-
-        companyFacts_url = f'https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_padded}.json'
-        companyFacts = requests.get(companyFacts_url, headers=headers)
-        companyFacts.raise_for_status()
-        
-        facts_data = companyFacts.json().get('facts', {})
-        
-        income_statement = process_income_statement(facts_data, filing_date, accession_number)
-        cash_flow_statement = process_cash_flow_statement(facts_data, filing_date, accession_number)
-        balance_sheet = process_balance_sheet(facts_data, filing_date, accession_number)
-        
-        income_statement.to_csv(f"{ticker}_income_statement.csv")
-        cash_flow_statement.to_csv(f"{ticker}_cash_flow_statement.csv")
-        balance_sheet.to_csv(f"{ticker}_balance_sheet.csv")
-        
-        logger.info(f"Financial statements saved as CSV files for {ticker}")
-        
-        return accession_number
-    except requests.RequestException as e:
+        statements = _cached_10k(ticker)
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching data for {ticker}: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, ijson.JSONError) as e:
         logger.error(f"Error parsing JSON data for {ticker}: {e}")
         return None
 
+    if statements is None:
+        return None
+
+    accession_number, income_statement, cash_flow_statement, balance_sheet = statements
+    _write_statements(ticker, income_statement, cash_flow_statement, balance_sheet)
+    return accession_number
+
+@functools.lru_cache(maxsize=256)
+def _cached_10k(ticker):
+    """
+    Fetch and extract the latest 10-K statements for a ticker, memoized.
+
+    Repeat queries for a ticker within the same process (common in notebook
+    exploration) reuse the extracted result instead of re-fetching and
+    re-parsing megabytes of JSON. Fetch and parse errors propagate so
+    transient failures are not cached; CSV writing lives in the callers so
+    cache hits still produce files.
+
+    Args:
+        ticker (str): The stock ticker symbol.
+
+    Returns:
+        tuple or None: (accession_number, income, cash_flow, balance_sheet)
+        with each statement as a label-to-value dict, or None if the ticker
+        has no CIK or no 10-K filing.
+    """
+    cik = get_cik(ticker)
+    if not cik:
+        return None
+
+    data, facts_json = asyncio.run(fetch_filing_data(str(cik).zfill(10)))
+    return _extract_statements(data, facts_json)
+
+def get_statements(ticker):
+    """
+    Get the latest 10-K statements for a ticker without writing CSVs.
+
+    Args:
+        ticker (str): The stock ticker symbol.
+
+    Returns:
+        tuple or None: (accession_number, income, cash_flow, balance_sheet)
+        with each statement as a label-to-value dict, or None if the ticker
+        has no CIK or no 10-K filing.
+
+    Raises:
+        httpx.HTTPError: If there's an error fetching the data from SEC.
+        json.JSONDecodeError: If there's an error parsing the JSON response.
+    """
+    return _cached_10k(ticker)
+
+def _extract_statements(data, facts_json):
+    """
+    Pull the latest 10-K accession and statement rows out of fetched data.
+
+    Args:
+        data (dict): The parsed submissions JSON.
+        facts_json (dict): The parsed companyfacts JSON.
+
+    Returns:
+        tuple or None: (accession_number, income, cash_flow, balance_sheet)
+        with each statement as a label-to-value dict, or None if no 10-K
+        was found.
+    """
+    recent = data['filings']['recent']
+    forms, dates, accns = recent['form'], recent['filingDate'], recent['accessionNumber']
+    idx = next((i for i, form in enumerate(forms) if form == '10-K'), None)
+
+    if idx is None:
+        logger.error("No 10-K filings found.")
+        return None
+
+    filing_date, accession_number = dates[idx], accns[idx]
+    logger.info(f"Latest 10-K filing date: {filing_date}")
+    logger.info(f"Accession number: {accession_number}")
+
+    facts_data = facts_json.get('facts', {})
+
+    income_statement = _proc_income(facts_data, accession_number)
+    cash_flow_statement = _proc_cash_flow(facts_data, accession_number)
+    balance_sheet = _proc_balance_sheet(facts_data, accession_number)
+
+    return accession_number, income_statement, cash_flow_statement, balance_sheet
+
+def _write_statements(ticker, income_statement, cash_flow_statement, balance_sheet):
+    """Write the three statement CSVs for a ticker."""
+    write_statement_csv(f"{ticker}_income_statement.csv", income_statement)
+    write_statement_csv(f"{ticker}_cash_flow_statement.csv", cash_flow_statement)
+    write_statement_csv(f"{ticker}_balance_sheet.csv", balance_sheet)
+    logger.info(f"Financial statements saved as CSV files for {ticker}")
+
+def _process_filing(ticker, data, facts_json):
+    """
+    Extract the latest 10-K from fetched filing data and write the CSVs.
+
+    Args:
+        ticker (str): The stock ticker symbol.
+        data (dict): The parsed submissions JSON.
+        facts_json (dict): The parsed companyfacts JSON.
+
+    Returns:
+        str or None: The accession number of the latest 10-K filing, or None
+        if no 10-K was found.
+    """
+    statements = _extract_statements(data, facts_json)
+    if statements is None:
+        return None
+
+    accession_number, income_statement, cash_flow_statement, balance_sheet = statements
+    _write_statements(ticker, income_statement, cash_flow_statement, balance_sheet)
+    return accession_number
+
+async def process_tickers(tickers):
+    """
+    Process a batch of tickers concurrently through a bounded request pool.
+
+    At most 8 tickers are in flight at once and all SEC requests share the
+    module-level _SEC_RATE_LIMIT (9/s) limiter, so large universes saturate
+    the SEC fair-use budget without tripping 429s. CSV writing runs in worker
+    threads to keep the event loop free.
+
+    Args:
+        tickers (list[str]): The stock ticker symbols to process.
+
+    Returns:
+        dict: A mapping of ticker to its latest 10-K accession number, or
+        None for tickers that failed.
+    """
+    semaphore = asyncio.Semaphore(8)
+
+    async with httpx.AsyncClient(http2=True, headers=_CLIENT_HEADERS,
+                                 limits=httpx.Limits(max_connections=4)) as client:
+        async def worker(ticker):
+            async with semaphore:
+                try:
+                    cik = await asyncio.to_thread(get_cik, ticker)
+                    if not cik:
+                        logger.error(f"CIK not found for {ticker}")
+                        return ticker, None
+                    data, facts_json = await fetch_filing_data(str(cik).zfill(10), client)
+                    accession_number = await asyncio.to_thread(_process_filing, ticker, data, facts_json)
+                    return ticker, accession_number
+                except httpx.HTTPError as e:
+                    logger.error(f"Error fetching data for {ticker}: {e}")
+                    return ticker, None
+                except (json.JSONDecodeError, ijson.JSONError) as e:
+                    logger.error(f"Error parsing JSON data for {ticker}: {e}")
+                    return ticker, None
+
+        results = await asyncio.gather(*(worker(ticker) for ticker in tickers))
+
+    return dict(results)
+
 def get_value_for_accession(item_data, accession_number):
     """
     Extract the value for the specific accession number from the item data.
 
+    An accession routinely carries several entries (the 10-K reports current
+    plus comparative fiscal periods under the same accn); like the original
+    loop, the scan returns the first match and stops there.
+
     Args:
         item_data (dict): The data for a specific financial item.
         accession_number (str): The accession number to look for.
@@ -124,40 +471,105 @@ def get_value_for_accession(item_data, accession_number):
     Returns:
         float or None: The value for the given accession number, or None if not found.
     """
-    if 'units' in item_data and 'USD' in item_data['units']:
-        for entry in item_data['units']['USD']:
-            if entry['accn'] == accession_number:
-                return entry['val']
-    return None
+    usd_entries = item_data.get('units', {}).get('USD')
+    if not usd_entries:
+        return None
+    return next((entry['val'] for entry in usd_entries
+                 if entry['accn'] == accession_number), None)
 
-def process_financial_statement(facts_data, items, filing_date, accession_number):
+def _compile_statement_processor(name, items):
+    """
+    Generate a straight-line extraction function for a statement table.
+
+    The statement tables are fixed at import time, so instead of looping over
+    (label, taxonomy, concept) tuples per call, each statement gets a
+    generated function with one unrolled lookup block per concept. This
+    removes the interpreter's loop and unpacking overhead from the per-filing
+    hot path; the logging of the generic loop is preserved.
+
+    Args:
+        name (str): The name to give the generated function.
+        items (tuple): The (label, taxonomy, concept) tuples to unroll.
+
+    Returns:
+        function: A function (facts_data, accession_number) -> dict mapping
+        statement labels to values.
+    """
+    src = [f"def {name}(facts_data, accession_number):", "    row = {}"]
+    for label, taxonomy, concept in items:
+        src += [
+            f"    item_data = facts_data.get({taxonomy!r}, _EMPTY).get({concept!r})",
+            "    if item_data is None:",
+            f"        logger.info({f'Item {label} not found in the data'!r})",
+            "    else:",
+            "        value = _lookup(item_data, accession_number)",
+            "        if value is None:",
+            f"            logger.info(f{f'No value found for {label} with accession number {{accession_number}}'!r})",
+            "        else:",
+            f"            row[{label!r}] = value",
+        ]
+    src.append("    return row")
+    namespace = {'_lookup': get_value_for_accession, '_EMPTY': {}, 'logger': logger}
+    exec(compile('\n'.join(src), '<generated>', 'exec'), namespace)
+    return namespace[name]
+
+_proc_income = _compile_statement_processor('_proc_income', _INCOME_ITEMS)
+_proc_cash_flow = _compile_statement_processor('_proc_cash_flow', _CASH_FLOW_ITEMS)
+_proc_balance_sheet = _compile_statement_processor('_proc_balance_sheet', _BALANCE_SHEET_ITEMS)
+
+def write_statement_csv(path, row):
+    """
+    Write a single-row financial statement to a CSV file.
+
+    Emitting the header and value lines directly avoids round-tripping a
+    handful of scalars through a DataFrame just to serialize two rows. The
+    leading index column matches what DataFrame.to_csv produced, so
+    consumers reading with pd.read_csv(path, index_col=0) are unaffected.
+
+    Args:
+        path (str): The destination CSV path.
+        row (dict): A mapping of statement labels to values.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([''] + list(row))
+        writer.writerow(['0'] + list(row.values()))
+
+def process_financial_statement(facts_data, items, filing_date, accession_number, as_dict=False):
     """
     Process financial statement data for a given set of items.
 
     Args:
         facts_data (dict): The complete facts data from SEC.
-        items (dict): A dictionary mapping item labels to their GAAP codes.
+        items (tuple): Pre-split (label, taxonomy, concept) tuples to extract.
         filing_date (str): The filing date of the 10-K.
         accession_number (str): The accession number of the 10-K.
+        as_dict (bool): Return the raw label-to-value dict instead of a
+            DataFrame; used by the CSV write path to skip pandas entirely.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the processed financial data.
+        pandas.DataFrame or dict: The processed financial data.
     """
-    data = {}
-    for label, item_key in items.items():
-        taxonomy, concept = item_key.split(':')
-        if taxonomy in facts_data and concept in facts_data[taxonomy]:
-            value = get_value_for_accession(facts_data[taxonomy][concept], accession_number)
-            if value is not None:
-                data[label] = [value]
-            else:
-                logger.info(f"No value found for {label} with accession number {accession_number}")
-        else:
+    row = {}
+    for label, taxonomy, concept in items:
+        item_data = facts_data.get(taxonomy, {}).get(concept)
+        if item_data is None:
             logger.info(f"Item {label} not found in the data")
-    
-    return pd.DataFrame(data)
-
-def process_income_statement(facts_data, filing_date, accession_number):
+            continue
+        value = get_value_for_accession(item_data, accession_number)
+        if value is None:
+            logger.info(f"No value found for {label} with accession number {accession_number}")
+            continue
+        row[label] = value
+
+    if as_dict:
+        return row
+    # Deferred so CSV-pipeline and CIK-only invocations never pay the
+    # ~300ms pandas import at startup; only DataFrame callers need it.
+    import pandas as pd
+    return pd.DataFrame([row]) if row else pd.DataFrame()
+
+def process_income_statement(facts_data, filing_date, accession_number, as_dict=False):
     """
     Process income statement data from the facts data.
 
@@ -165,21 +577,14 @@ def process_income_statement(facts_data, filing_date, accession_number):
         facts_data (dict): The complete facts data from SEC.
         filing_date (str): The filing date of the 10-K.
         accession_number (str): The accession number of the 10-K.
+        as_dict (bool): Return the raw label-to-value dict instead of a DataFrame.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the processed income statement data.
+        pandas.DataFrame or dict: The processed income statement data.
     """
-    income_items = {
-        'Revenue': 'us-gaap:Revenues',
-        'Cost of Revenue': 'us-gaap:CostOfRevenue',
-        'Gross Profit': 'us-gaap:GrossProfit',
-        'Operating Expenses': 'us-gaap:OperatingExpenses',
-        'Operating Income': 'us-gaap:OperatingIncomeLoss',
-        'Net Income': 'us-gaap:NetIncomeLoss',
-    }
-    return process_financial_statement(facts_data, income_items, filing_date, accession_number)
+    return process_financial_statement(facts_data, _INCOME_ITEMS, filing_date, accession_number, as_dict=as_dict)
 
-def process_cash_flow_statement(facts_data, filing_date, accession_number):
+def process_cash_flow_statement(facts_data, filing_date, accession_number, as_dict=False):
     """
     Process cash flow statement data from the facts data.
 
@@ -187,19 +592,14 @@ def process_cash_flow_statement(facts_data, filing_date, accession_number):
         facts_data (dict): The complete facts data from SEC.
         filing_date (str): The filing date of the 10-K.
         accession_number (str): The accession number of the 10-K.
+        as_dict (bool): Return the raw label-to-value dict instead of a DataFrame.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the processed cash flow statement data.
+        pandas.DataFrame or dict: The processed cash flow statement data.
     """
-    cash_flow_items = {
-        'Cash from Operating Activities': 'us-gaap:NetCashProvidedByUsedInOperatingActivities',
-        'Cash from Investing Activities': 'us-gaap:NetCashProvidedByUsedInInvestingActivities',
-        'Cash from Financing Activities': 'us-gaap:NetCashProvidedByUsedInFinancingActivities',
-        'Net Change in Cash': 'us-gaap:NetIncreaseDecreaseInCash',
-    }
-    return process_financial_statement(facts_data, cash_flow_items, filing_date, accession_number)
+    return process_financial_statement(facts_data, _CASH_FLOW_ITEMS, filing_date, accession_number, as_dict=as_dict)
 
-def process_balance_sheet(facts_data, filing_date, accession_number):
+def process_balance_sheet(facts_data, filing_date, accession_number, as_dict=False):
     """
     Process balance sheet data from the facts data.
 
@@ -207,26 +607,33 @@ def process_balance_sheet(facts_data, filing_date, accession_number):
         facts_data (dict): The complete facts data from SEC.
         filing_date (str): The filing date of the 10-K.
         accession_number (str): The accession number of the 10-K.
+        as_dict (bool): Return the raw label-to-value dict instead of a DataFrame.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the processed balance sheet data.
+        pandas.DataFrame or dict: The processed balance sheet data.
     """
-    balance_sheet_items = {
-        'Total Assets': 'us-gaap:Assets',
-        'Total Liabilities': 'us-gaap:Liabilities',
-        'Total Equity': 'us-gaap:StockholdersEquity',
-        'Cash and Cash Equivalents': 'us-gaap:CashAndCashEquivalentsAtCarryingValue',
-        'Total Current Assets': 'us-gaap:AssetsCurrent',
-        'Total Current Liabilities': 'us-gaap:LiabilitiesCurrent',
-    }
-    return process_financial_statement(facts_data, balance_sheet_items, filing_date, accession_number)
+    return process_financial_statement(facts_data, _BALANCE_SHEET_ITEMS, filing_date, accession_number, as_dict=as_dict)
 
 if __name__ == "__main__":
-    import sys
-    ticker = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TICKER
-    latest_10k_accession = get_latest_10k_url(ticker)
-    if latest_10k_accession:
-        logger.info(f"Latest 10-K accession number for {ticker}: {latest_10k_accession}")
+    import argparse
+    parser = argparse.ArgumentParser(description="Extract financial data from SEC EDGAR 10-K filings.")
+    parser.add_argument("ticker", nargs="?", default=DEFAULT_TICKER,
+                        help="Single ticker to process (default: %(default)s).")
+    parser.add_argument("--tickers", nargs="+", metavar="TICKER",
+                        help="Process multiple tickers concurrently.")
+    args = parser.parse_args()
+
+    if args.tickers:
+        results = asyncio.run(process_tickers(args.tickers))
+        for ticker, accession_number in results.items():
+            if accession_number:
+                logger.info(f"Latest 10-K accession number for {ticker}: {accession_number}")
+            else:
+                logger.error(f"Failed to process latest 10-K for {ticker}")
     else:
-        logger.error(f"Failed to process latest 10-K for {ticker}")
+        latest_10k_accession = get_latest_10k_url(args.ticker)
+        if latest_10k_accession:
+            logger.info(f"Latest 10-K accession number for {args.ticker}: {latest_10k_accession}")
+        else:
+            logger.error(f"Failed to process latest 10-K for {args.ticker}")
 
@@ -0,0 +1,5 @@
+# Copy this file to config.py and fill in your own contact details.
+# SEC's fair-use policy requires a real contact in the User-Agent header:
+# https://www.sec.gov/os/accessing-edgar-data
+SEC_API_HEADERS = {"User-Agent": "Your Name your.email@example.com"}
+DEFAULT_TICKER = "AAPL"
@@ -1,6 +1,10 @@
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from unittest.mock import patch, AsyncMock, MagicMock
 import pandas as pd
+import EDGAR_SEC
 from EDGAR_SEC import (
     get_cik, get_latest_10k_url, get_value_for_accession,
     process_financial_statement, process_income_statement,
@@ -9,26 +13,70 @@ from EDGAR_SEC import (
 
 class TestEDGARSEC(unittest.TestCase):
 
-    @patch('EDGAR_SEC.requests.get')
+    def setUp(self):
+        EDGAR_SEC._cached_10k.cache_clear()
+
+    @patch('EDGAR_SEC.SESSION.get')
     def test_get_cik(self, mock_get):
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.text = "aapl\t0000320193\nmsft\t0000789019"
         mock_get.return_value = mock_response
 
-        self.assertEqual(get_cik('AAPL'), 320193)
-        self.assertEqual(get_cik('MSFT'), 789019)
-        self.assertIsNone(get_cik('INVALID'))
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(EDGAR_SEC, '_CACHE_DIR', Path(tmp)), \
+                 patch.object(EDGAR_SEC, '_CIK_CACHE', None):
+                self.assertEqual(get_cik('AAPL'), 320193)
+                self.assertEqual(get_cik('MSFT'), 789019)
+                self.assertIsNone(get_cik('INVALID'))
+                # The ticker list is fetched once and served from cache after that.
+                self.assertEqual(mock_get.call_count, 1)
 
     @patch('EDGAR_SEC.get_cik')
-    @patch('EDGAR_SEC.requests.get')
-    def test_get_latest_10k_url(self, mock_get, mock_get_cik):
+    @patch('EDGAR_SEC.fetch_filing_data', new_callable=AsyncMock)
+    @patch('EDGAR_SEC._write_statements')
+    def test_get_latest_10k_url(self, mock_write, mock_fetch, mock_get_cik):
         mock_get_cik.return_value = 320193
-        mock_response = MagicMock()
-        mock_response.text = '{"filings": {"recent": [{"form": "10-K", "filingDate": "2023-01-01", "accessionNumber": "0000320193-23-000001"}]}}'
-        mock_get.return_value = mock_response
+        mock_fetch.return_value = (
+            {"filings": {"recent": {"form": ["10-K"], "filingDate": ["2023-01-01"], "accessionNumber": ["0000320193-23-000001"]}}},
+            {'facts': {}},
+        )
 
         result = get_latest_10k_url('AAPL')
         self.assertEqual(result, "0000320193-23-000001")
+        # Repeat queries are served from the per-process cache.
+        result = get_latest_10k_url('AAPL')
+        self.assertEqual(result, "0000320193-23-000001")
+        self.assertEqual(mock_fetch.call_count, 1)
+
+    @patch('EDGAR_SEC.get_cik')
+    @patch('EDGAR_SEC.fetch_filing_data', new_callable=AsyncMock)
+    def test_get_statements(self, mock_fetch, mock_get_cik):
+        mock_get_cik.return_value = 320193
+        mock_fetch.return_value = (
+            {"filings": {"recent": {"form": ["10-K"], "filingDate": ["2023-01-01"], "accessionNumber": ["0000320193-23-000001"]}}},
+            {'facts': {'us-gaap': {'Revenues': {'units': {'USD': [{'accn': '0000320193-23-000001', 'val': 1000}]}}}}},
+        )
+
+        accession_number, income, cash_flow, balance_sheet = EDGAR_SEC.get_statements('AAPL')
+        self.assertEqual(accession_number, "0000320193-23-000001")
+        self.assertEqual(income, {'Revenue': 1000})
+        self.assertEqual(cash_flow, {})
+        self.assertEqual(balance_sheet, {})
+
+    @patch('EDGAR_SEC.get_cik')
+    @patch('EDGAR_SEC.fetch_filing_data', new_callable=AsyncMock)
+    @patch('EDGAR_SEC._write_statements')
+    def test_process_tickers(self, mock_write, mock_fetch, mock_get_cik):
+        mock_get_cik.return_value = 320193
+        mock_fetch.return_value = (
+            {"filings": {"recent": {"form": ["10-K"], "filingDate": ["2023-01-01"], "accessionNumber": ["0000320193-23-000001"]}}},
+            {'facts': {}},
+        )
+
+        results = asyncio.run(EDGAR_SEC.process_tickers(['AAPL', 'MSFT']))
+        self.assertEqual(results, {'AAPL': "0000320193-23-000001",
+                                   'MSFT': "0000320193-23-000001"})
 
     def test_get_value_for_accession(self):
         item_data = {
@@ -42,6 +90,15 @@ class TestEDGARSEC(unittest.TestCase):
         self.assertEqual(get_value_for_accession(item_data, '0000320193-23-000001'), 1000)
         self.assertIsNone(get_value_for_accession(item_data, 'INVALID'))
 
+    def test_get_value_for_accession_duplicate_accn(self):
+        # A 10-K reports current plus comparative periods under one accn;
+        # the first entry wins, regardless of how long the USD list is.
+        entries = [{'accn': f'filler-{i}', 'val': i} for i in range(100)]
+        entries += [{'accn': '0000320193-23-000001', 'val': 1000},
+                    {'accn': '0000320193-23-000001', 'val': 900}]
+        item_data = {'units': {'USD': entries}}
+        self.assertEqual(get_value_for_accession(item_data, '0000320193-23-000001'), 1000)
+
     def test_process_financial_statement(self):
         facts_data = {
             'us-gaap': {
@@ -49,7 +106,7 @@ class TestEDGARSEC(unittest.TestCase):
                 'NetIncome': {'units': {'USD': [{'accn': '0000320193-23-000001', 'val': 200}]}}
             }
         }
-        items = {'Revenue': 'us-gaap:Revenue', 'Net Income': 'us-gaap:NetIncome'}
+        items = (('Revenue', 'us-gaap', 'Revenue'), ('Net Income', 'us-gaap', 'NetIncome'))
         result = process_financial_statement(facts_data, items, '2023-01-01', '0000320193-23-000001')
         
         expected = pd.DataFrame({'Revenue': [1000], 'Net Income': [200]})
@@ -57,6 +114,28 @@ class TestEDGARSEC(unittest.TestCase):
 
     # ... existing code ...
 
+    def test_generated_statement_processors(self):
+        facts_data = {
+            'us-gaap': {
+                'Revenues': {'units': {'USD': [{'accn': '0000320193-23-000001', 'val': 1000}]}},
+                'NetIncomeLoss': {'units': {'USD': [{'accn': '0000320193-23-000001', 'val': 200}]}}
+            }
+        }
+        row = EDGAR_SEC._proc_income(facts_data, '0000320193-23-000001')
+        self.assertEqual(row, {'Revenue': 1000, 'Net Income': 200})
+        # The generated function matches the generic loop exactly.
+        self.assertEqual(row, process_income_statement(
+            facts_data, '2023-01-01', '0000320193-23-000001', as_dict=True))
+
+    def test_write_statement_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "statement.csv"
+            EDGAR_SEC.write_statement_csv(path, {'Revenue': 1000, 'Net Income': 200})
+            self.assertEqual(path.read_text(), ',Revenue,Net Income\n0,1000,200\n')
+            # Round-trips the way the to_csv output always has.
+            frame = pd.read_csv(path, index_col=0)
+            self.assertEqual(frame.loc[0, 'Revenue'], 1000)
+
     def test_process_income_statement(self):
         facts_data = {
             'us-gaap': {